@@ -7,85 +7,355 @@ rest of the code can work with clear, high‑level functions.
 
 from __future__ import annotations
 
+import queue
 import sqlite3
-from contextlib import closing
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from models import Business, Review, ReportSummary
 
 
 DB_FILE = Path(__file__).with_name("town_square.db")
 
+RowFactory = Optional[Callable[[sqlite3.Cursor, tuple], Any]]
+
+# Oldest SQLite library the queries support: add_business uses
+# INSERT ... RETURNING (3.35) and add_reviews_bulk uses UPDATE ... FROM (3.33).
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+# Bumped after every successful write, so callers can cache query results
+# and tell when they have gone stale.
+DATA_GENERATION = 0
+
+# Connections are kept open and reused instead of being reopened on every
+# call, so the file open and pragma setup only happen once per connection.
+# Reads share a pool of read-only connections; all writes go through one
+# read-write connection, since SQLite serializes writers anyway. With WAL
+# enabled, readers do not block the writer and vice versa.
+READ_POOL_SIZE = 4
+_read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(
+    maxsize=READ_POOL_SIZE
+)
+_write_conn: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA cache_size=-20000",  # about 20 MB of page cache
+)
+
+# Categories are also stored as small integers so filters and indexes
+# compare integers instead of text. The text column is kept for display.
+CATEGORY_IDS = {"Food": 1, "Retail": 2, "Services": 3}
+
+# Column list in the same order as the Business fields, so a result tuple
+# can be passed straight to Business(*row).
+BUSINESS_COLUMNS = (
+    "id, name, category, average_rating, review_count, deal_text, is_favorite"
+)
+
+# Full schema, applied in one script. Composite indexes match the
+# WHERE + ORDER BY combinations used by the directory, recommendation, and
+# report queries, so SQLite can read rows already in order instead of
+# sorting them every time.
+_SCHEMA_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS businesses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL CHECK (length(name) > 0),
+    category TEXT NOT NULL CHECK (length(category) > 0),
+    category_id INTEGER CHECK (category_id IN (1, 2, 3)),
+    deal_text TEXT NOT NULL,
+    average_rating REAL NOT NULL DEFAULT 0.0,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    is_favorite INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    business_id INTEGER NOT NULL,
+    rating INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (business_id) REFERENCES businesses (id)
+        ON DELETE CASCADE
+);
+
+-- Running totals for the Reports screen, kept in one row so the report
+-- is a single lookup. The triggers below keep it in step with every
+-- insert, update, and delete on businesses. sum_rating adds up the
+-- average ratings of businesses that have at least one review.
+CREATE TABLE IF NOT EXISTS app_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    sum_rating REAL NOT NULL,
+    rated_count INTEGER NOT NULL,
+    fav_count INTEGER NOT NULL,
+    total_count INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO app_stats (id, sum_rating, rated_count, fav_count, total_count)
+SELECT
+    0,
+    COALESCE(SUM(CASE WHEN review_count > 0 THEN average_rating END), 0.0),
+    COUNT(CASE WHEN review_count > 0 THEN 1 END),
+    COUNT(CASE WHEN is_favorite != 0 THEN 1 END),
+    COUNT(*)
+FROM businesses;
+
+CREATE TRIGGER IF NOT EXISTS trg_stats_business_insert
+AFTER INSERT ON businesses
+BEGIN
+    UPDATE app_stats SET
+        sum_rating = sum_rating
+            + CASE WHEN NEW.review_count > 0 THEN NEW.average_rating ELSE 0 END,
+        rated_count = rated_count + (NEW.review_count > 0),
+        fav_count = fav_count + (NEW.is_favorite != 0),
+        total_count = total_count + 1
+    WHERE id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stats_business_update
+AFTER UPDATE OF average_rating, review_count, is_favorite ON businesses
+BEGIN
+    UPDATE app_stats SET
+        sum_rating = sum_rating
+            + CASE WHEN NEW.review_count > 0 THEN NEW.average_rating ELSE 0 END
+            - CASE WHEN OLD.review_count > 0 THEN OLD.average_rating ELSE 0 END,
+        rated_count = rated_count + (NEW.review_count > 0) - (OLD.review_count > 0),
+        fav_count = fav_count + (NEW.is_favorite != 0) - (OLD.is_favorite != 0)
+    WHERE id = 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_stats_business_delete
+AFTER DELETE ON businesses
+BEGIN
+    UPDATE app_stats SET
+        sum_rating = sum_rating
+            - CASE WHEN OLD.review_count > 0 THEN OLD.average_rating ELSE 0 END,
+        rated_count = rated_count - (OLD.review_count > 0),
+        fav_count = fav_count - (OLD.is_favorite != 0),
+        total_count = total_count - 1
+    WHERE id = 0;
+END;
+
+CREATE INDEX IF NOT EXISTS idx_biz_cat_rating
+    ON businesses (category_id, average_rating DESC, review_count DESC, name ASC);
+CREATE INDEX IF NOT EXISTS idx_biz_fav_rating
+    ON businesses (is_favorite DESC, average_rating DESC, review_count DESC, name ASC);
+CREATE INDEX IF NOT EXISTS idx_biz_fav_only
+    ON businesses (category_id, average_rating DESC, review_count DESC, name ASC)
+    WHERE is_favorite = 1;
+CREATE INDEX IF NOT EXISTS idx_biz_rated
+    ON businesses (average_rating DESC, review_count DESC, name ASC)
+    WHERE review_count > 0;
+CREATE INDEX IF NOT EXISTS idx_biz_name ON businesses (name);
+CREATE INDEX IF NOT EXISTS idx_reviews_business ON reviews (business_id);
+
+COMMIT;
+"""
+
 
-def get_connection() -> sqlite3.Connection:
-    """Return a connection to the SQLite database with row access by name."""
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
+def _open_connection(read_only: bool) -> sqlite3.Connection:
+    """Open a new autocommit connection and apply the shared pragmas."""
+    if read_only:
+        conn = sqlite3.connect(
+            f"{DB_FILE.as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+    else:
+        conn = sqlite3.connect(
+            DB_FILE, check_same_thread=False, isolation_level=None
+        )
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
-def initialize_database() -> None:
-    """Create tables if they do not already exist and insert starter data."""
-    with closing(get_connection()) as conn, conn:
+@contextmanager
+def get_ro_connection(row_factory: RowFactory = None) -> Iterator[sqlite3.Connection]:
+    """
+    Borrow a read-only connection from the shared pool.
+
+    Rows are plain tuples unless a ``row_factory`` such as ``sqlite3.Row``
+    is requested. The connection is returned to the pool on exit instead
+    of being closed.
+    """
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = _open_connection(read_only=True)
+    conn.row_factory = row_factory
+
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@contextmanager
+def get_rw_connection(row_factory: RowFactory = None) -> Iterator[sqlite3.Connection]:
+    """
+    Use the single read-write connection, holding the write lock.
+
+    Rows are plain tuples unless a ``row_factory`` is requested. The
+    connection is in autocommit mode, so writes must be wrapped in
+    ``transaction(conn)``.
+    """
+    global _write_conn
+    with _write_lock:
+        if _write_conn is None:
+            _write_conn = _open_connection(read_only=False)
+        _write_conn.row_factory = row_factory
+        try:
+            yield _write_conn
+        finally:
+            if _write_conn.in_transaction:
+                _write_conn.rollback()
+
+
+@contextmanager
+def transaction(
+    conn: sqlite3.Connection, immediate: bool = False
+) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block of writes inside an explicit BEGIN/COMMIT.
+
+    ``immediate=True`` takes the write lock up front (BEGIN IMMEDIATE),
+    which suits batches that read before they write.
+    """
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _bump_generation() -> None:
+    """Mark cached query results as stale after a write."""
+    global DATA_GENERATION
+    DATA_GENERATION += 1
+
+
+def close_connections() -> None:
+    """Close every open connection (used when the app shuts down)."""
+    global _write_conn
+    with _write_lock:
+        if _write_conn is not None:
+            # SQLite recommends running optimize just before closing: it
+            # re-analyzes only the tables whose statistics have drifted.
+            try:
+                _write_conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # Statistics are a hint; never block shutdown on them.
+            _write_conn.close()
+            _write_conn = None
+
+    while True:
+        try:
+            _read_pool.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+def _migrate_schema(conn: sqlite3.Connection) -> None:
+    """Bring a database created by an older version up to the current schema."""
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(businesses)")}
+    if columns and "category_id" not in columns:
         conn.execute(
             """
-            CREATE TABLE IF NOT EXISTS businesses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                category TEXT NOT NULL,
-                deal_text TEXT NOT NULL,
-                average_rating REAL NOT NULL DEFAULT 0.0,
-                review_count INTEGER NOT NULL DEFAULT 0,
-                is_favorite INTEGER NOT NULL DEFAULT 0
-            )
+            ALTER TABLE businesses
+            ADD COLUMN category_id INTEGER CHECK (category_id IN (1, 2, 3))
             """
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS reviews (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                business_id INTEGER NOT NULL,
-                rating INTEGER NOT NULL,
-                text TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (business_id) REFERENCES businesses (id)
-                    ON DELETE CASCADE
-            )
-            """
+        # Backfill from CATEGORY_IDS; unexpected categories stay NULL, the
+        # same as add_business stores them.
+        conn.executemany(
+            "UPDATE businesses SET category_id = ? WHERE category = ?",
+            [(category_id, name) for name, category_id in CATEGORY_IDS.items()],
         )
+        # Older builds indexed the text column under these names; the
+        # schema script recreates them on category_id.
+        conn.execute("DROP INDEX IF EXISTS idx_biz_cat_rating")
+        conn.execute("DROP INDEX IF EXISTS idx_biz_fav_only")
 
-        # If there are no businesses yet, insert a small starter set so
-        # the directory feels alive on first launch.
-        cur = conn.execute("SELECT COUNT(*) AS count FROM businesses")
-        if cur.fetchone()["count"] == 0:
-            starter_businesses = [
-                ("Sunrise Café", "Food", "Buy 1 breakfast, get 2nd 50% off"),
-                ("Corner Book Nook", "Retail", "10% off local authors"),
-                ("Sparkle Cleaners", "Services", "First shirt pressed for free"),
-                ("Green Leaf Market", "Food", "Free fruit sample with purchase"),
-                ("TechFix Repair", "Services", "Free diagnostics for laptops"),
-                ("Tiny Treasures Gifts", "Retail", "Free gift wrapping this week"),
-            ]
-            conn.executemany(
-                """
-                INSERT INTO businesses (name, category, deal_text)
-                VALUES (?, ?, ?)
-                """,
-                starter_businesses,
-            )
-
-
-def _row_to_business(row: sqlite3.Row) -> Business:
-    return Business(
-        id=row["id"],
-        name=row["name"],
-        category=row["category"],
-        average_rating=float(row["average_rating"]),
-        review_count=int(row["review_count"]),
-        deal_text=row["deal_text"],
-        is_favorite=bool(row["is_favorite"]),
-    )
+
+def initialize_database() -> None:
+    """Create tables if they do not already exist and insert starter data."""
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        required = ".".join(map(str, MIN_SQLITE_VERSION))
+        raise RuntimeError(
+            f"Town Square needs SQLite {required} or newer, but this Python "
+            f"is using SQLite {sqlite3.sqlite_version}. Please install a newer "
+            "Python build (python.org installers include a recent SQLite)."
+        )
+    with get_rw_connection(row_factory=sqlite3.Row) as conn:
+        # WAL is a persistent property of the database file, so it only
+        # needs to be switched on here.
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        with transaction(conn):
+            _migrate_schema(conn)
+
+        # executescript commits any open transaction first, so the schema
+        # script carries its own BEGIN/COMMIT.
+        conn.executescript(_SCHEMA_SQL)
+
+        with transaction(conn):
+            # If there are no businesses yet, insert a small starter set so
+            # the directory feels alive on first launch.
+            cur = conn.execute("SELECT EXISTS (SELECT 1 FROM businesses) AS has_rows")
+            if not cur.fetchone()["has_rows"]:
+                starter_businesses = [
+                    ("Sunrise Café", "Food", "Buy 1 breakfast, get 2nd 50% off"),
+                    ("Corner Book Nook", "Retail", "10% off local authors"),
+                    ("Sparkle Cleaners", "Services", "First shirt pressed for free"),
+                    ("Green Leaf Market", "Food", "Free fruit sample with purchase"),
+                    ("TechFix Repair", "Services", "Free diagnostics for laptops"),
+                    ("Tiny Treasures Gifts", "Retail", "Free gift wrapping this week"),
+                ]
+                conn.executemany(
+                    """
+                    INSERT INTO businesses (name, category, category_id, deal_text)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (name, category, CATEGORY_IDS[category], deal)
+                        for name, category, deal in starter_businesses
+                    ],
+                )
+
+        # Refresh planner statistics so the indexes are chosen.
+        conn.execute("ANALYZE")
+
+
+def _fetch_businesses(
+    conn: sqlite3.Connection, query: str, params: Iterable = ()
+) -> List[Business]:
+    """
+    Run a query that selects ``BUSINESS_COLUMNS`` and build Business objects.
+
+    Rows come back as plain tuples in ``Business`` field order, which skips
+    the per-row ``sqlite3.Row`` lookups and maps straight onto the model.
+    """
+    cur = conn.execute(query, params)
+    # Iterate the cursor directly so rows stream in rather than being
+    # collected into an intermediate list first.
+    return [Business(*row) for row in cur]
 
 
 def add_business(name: str, category: str, deal_text: str) -> Business:
@@ -95,39 +365,42 @@ def add_business(name: str, category: str, deal_text: str) -> Business:
     The UI is responsible for validating the inputs and restricting the
     category to the allowed values (Food, Retail, Services).
     """
-    with closing(get_connection()) as conn, conn:
-        cur = conn.execute(
+    # Stripped in Python: SQLite's TRIM() only removes spaces, and the
+    # validators measure with str.strip() (tabs and newlines too).
+    category = category.strip()
+    with get_rw_connection() as conn, transaction(conn):
+        # RETURNING hands back the stored row (with column defaults)
+        # without a second SELECT. It reports values before column affinity
+        # is applied, so the REAL default is cast to keep it a float.
+        (business,) = _fetch_businesses(
+            conn,
             """
-            INSERT INTO businesses (name, category, deal_text)
-            VALUES (?, ?, ?)
+            INSERT INTO businesses (name, category, category_id, deal_text)
+            VALUES (?, ?, ?, ?)
+            RETURNING id, name, category, CAST(average_rating AS REAL),
+                review_count, deal_text, is_favorite
             """,
-            (name.strip(), category.strip(), deal_text.strip()),
+            (name.strip(), category, CATEGORY_IDS.get(category), deal_text.strip()),
         )
-        new_id = cur.lastrowid
-
-        cur = conn.execute("SELECT * FROM businesses WHERE id = ?", (new_id,))
-        row = cur.fetchone()
+        _bump_generation()
 
-    return _row_to_business(row)
+    return business
 
 
-def get_businesses(
-    category_filter: Optional[str] = None,
-    sort_by_rating_desc: bool = False,
-    favorites_only: bool = False,
-) -> List[Business]:
-    """Return a list of businesses matching the provided filters."""
-    query = "SELECT * FROM businesses"
+def _build_business_query(
+    filter_by_category: bool, favorites_only: bool, sort_by_rating_desc: bool
+) -> str:
+    query = f"SELECT {BUSINESS_COLUMNS} FROM businesses"
     clauses = []
-    params: list = []
-
-    if category_filter and category_filter != "All":
-        clauses.append("category = ?")
-        params.append(category_filter)
 
+    # The favorites flag is the more selective filter, so it goes first and
+    # lets SQLite use the small partial favorites index.
     if favorites_only:
         clauses.append("is_favorite = 1")
 
+    if filter_by_category:
+        clauses.append("category_id = ?")
+
     if clauses:
         query += " WHERE " + " AND ".join(clauses)
 
@@ -136,18 +409,44 @@ def get_businesses(
     else:
         query += " ORDER BY name ASC"
 
-    with closing(get_connection()) as conn:
-        cur = conn.execute(query, params)
-        return [_row_to_business(row) for row in cur.fetchall()]
+    return query
+
+
+# Every filter combination gets one fixed SQL string, built once at import,
+# so repeated calls reuse the same prepared statement from the cache.
+_BUSINESS_QUERIES = {
+    (cat, fav, sort): _build_business_query(cat, fav, sort)
+    for cat in (False, True)
+    for fav in (False, True)
+    for sort in (False, True)
+}
+
+
+def get_businesses(
+    category_filter: Optional[str] = None,
+    sort_by_rating_desc: bool = False,
+    favorites_only: bool = False,
+) -> List[Business]:
+    """Return a list of businesses matching the provided filters."""
+    filter_by_category = bool(category_filter and category_filter != "All")
+    query = _BUSINESS_QUERIES[
+        (filter_by_category, bool(favorites_only), bool(sort_by_rating_desc))
+    ]
+    # Unknown categories bind 0, which matches no row.
+    params = (CATEGORY_IDS.get(category_filter, 0),) if filter_by_category else ()
+
+    with get_ro_connection() as conn:
+        return _fetch_businesses(conn, query, params)
 
 
 def toggle_favorite(business_id: int, make_favorite: bool) -> None:
     """Set or clear the favorite flag for a business."""
-    with closing(get_connection()) as conn, conn:
+    with get_rw_connection() as conn, transaction(conn):
         conn.execute(
             "UPDATE businesses SET is_favorite = ? WHERE id = ?",
             (1 if make_favorite else 0, business_id),
         )
+        _bump_generation()
 
 
 def add_review(business_id: int, rating: int, text: str, created_at: str) -> None:
@@ -156,7 +455,7 @@ def add_review(business_id: int, rating: int, text: str, created_at: str) -> Non
 
     The UI is responsible for validating rating range and text length.
     """
-    with closing(get_connection()) as conn, conn:
+    with get_rw_connection() as conn, transaction(conn):
         conn.execute(
             """
             INSERT INTO reviews (business_id, rating, text, created_at)
@@ -165,59 +464,85 @@ def add_review(business_id: int, rating: int, text: str, created_at: str) -> Non
             (business_id, rating, text, created_at),
         )
 
-        # Recalculate average rating for the business.
-        cur = conn.execute(
+        # Fold the new rating into the running average instead of
+        # re-scanning every review for this business.
+        conn.execute(
+            """
+            UPDATE businesses
+            SET average_rating = (average_rating * review_count + ?) / (review_count + 1),
+                review_count = review_count + 1
+            WHERE id = ?
+            """,
+            (rating, business_id),
+        )
+        _bump_generation()
+
+
+def add_reviews_bulk(reviews: Iterable[Tuple[int, int, str, str]]) -> None:
+    """
+    Store many reviews at once and update each business's average rating.
+
+    Each item is ``(business_id, rating, text, created_at)``. All rows are
+    written in one transaction, and every affected business is updated
+    with a single aggregated UPDATE.
+    """
+    with get_rw_connection() as conn, transaction(conn, immediate=True):
+        cur = conn.execute("SELECT COALESCE(MAX(id), 0) AS last_id FROM reviews")
+        (last_id,) = cur.fetchone()
+
+        conn.executemany(
             """
-            SELECT AVG(rating) AS avg_rating, COUNT(*) AS review_count
-            FROM reviews
-            WHERE business_id = ?
+            INSERT INTO reviews (business_id, rating, text, created_at)
+            VALUES (?, ?, ?, ?)
             """,
-            (business_id,),
+            reviews,
         )
-        row = cur.fetchone()
-        avg_rating = float(row["avg_rating"] or 0.0)
-        count = int(row["review_count"] or 0)
 
+        # Review ids only grow (AUTOINCREMENT), so everything above the
+        # previous maximum belongs to this batch.
         conn.execute(
             """
             UPDATE businesses
-            SET average_rating = ?, review_count = ?
-            WHERE id = ?
+            SET average_rating = (average_rating * review_count + t.delta_sum)
+                    / (review_count + t.delta_count),
+                review_count = review_count + t.delta_count
+            FROM (
+                SELECT business_id, COUNT(*) AS delta_count, SUM(rating) AS delta_sum
+                FROM reviews
+                WHERE id > ?
+                GROUP BY business_id
+            ) AS t
+            WHERE businesses.id = t.business_id
             """,
-            (avg_rating, count, business_id),
+            (last_id,),
         )
+        _bump_generation()
 
 
 def get_reports_summary() -> ReportSummary:
     """Compute aggregate values used by the Reports screen."""
-    with closing(get_connection()) as conn:
-        cur = conn.execute("SELECT COUNT(*) AS count FROM businesses")
-        total_businesses = int(cur.fetchone()["count"])
-
+    with get_ro_connection() as conn:
+        # The headline numbers are maintained by triggers in app_stats,
+        # so they come from one row instead of a table scan.
         cur = conn.execute(
             """
-            SELECT AVG(average_rating) AS avg_rating
-            FROM businesses
-            WHERE review_count > 0
+            SELECT sum_rating, rated_count, fav_count, total_count
+            FROM app_stats
+            WHERE id = 0
             """
         )
-        row = cur.fetchone()
-        average_rating = float(row["avg_rating"] or 0.0)
+        sum_rating, rated_count, favorite_count, total_businesses = cur.fetchone()
+        average_rating = sum_rating / rated_count if rated_count else 0.0
 
-        cur = conn.execute(
-            """
-            SELECT * FROM businesses
+        top_businesses = _fetch_businesses(
+            conn,
+            f"""
+            SELECT {BUSINESS_COLUMNS} FROM businesses
             WHERE review_count > 0
             ORDER BY average_rating DESC, review_count DESC, name ASC
             LIMIT 3
-            """
-        )
-        top_businesses = [_row_to_business(r) for r in cur.fetchall()]
-
-        cur = conn.execute(
-            "SELECT COUNT(*) AS count FROM businesses WHERE is_favorite = 1"
+            """,
         )
-        favorite_count = int(cur.fetchone()["count"])
 
         return ReportSummary(
             total_businesses=total_businesses,
@@ -227,6 +552,22 @@ def get_reports_summary() -> ReportSummary:
         )
 
 
+# Preferred-category matches, or every business when the category has no
+# matches, ranked in a single statement. Only one side of the UNION ALL can
+# produce rows, so the shared ORDER BY gives the same ranking either way.
+_RECOMMENDATION_QUERY = f"""
+    WITH preferred AS (
+        SELECT {BUSINESS_COLUMNS} FROM businesses
+        WHERE ? IS NULL OR category_id = ?
+    )
+    SELECT * FROM preferred
+    UNION ALL
+    SELECT {BUSINESS_COLUMNS} FROM businesses
+    WHERE NOT EXISTS (SELECT 1 FROM preferred)
+    ORDER BY is_favorite DESC, average_rating DESC, review_count DESC, name ASC
+"""
+
+
 def get_recommended_businesses(preferred_category: Optional[str]) -> List[Business]:
     """
     Recommend businesses based on favorites, preferred category, and ratings.
@@ -236,29 +577,13 @@ def get_recommended_businesses(preferred_category: Optional[str]) -> List[Busine
     2. Then show high‑rated businesses in that category.
     3. Finally, fall back to overall high‑rated favorites or all businesses.
     """
-    with closing(get_connection()) as conn:
-        params: list = []
-        where_clauses = []
-        order_clause = " ORDER BY is_favorite DESC, average_rating DESC, review_count DESC, name ASC"
-
-        if preferred_category and preferred_category != "All":
-            where_clauses.append("category = ?")
-            params.append(preferred_category)
-
-        base_query = "SELECT * FROM businesses"
-        if where_clauses:
-            base_query += " WHERE " + " AND ".join(where_clauses)
-
-        cur = conn.execute(base_query + order_clause, params)
-        results = [_row_to_business(r) for r in cur.fetchall()]
-
-        # If there are no results for the requested category,
-        # fall back to all businesses ranked by favorites and rating.
-        if not results:
-            cur = conn.execute(
-                "SELECT * FROM businesses" + order_clause,
-            )
-            results = [_row_to_business(r) for r in cur.fetchall()]
-
-    return results
+    if not preferred_category or preferred_category == "All":
+        category_id = None
+    else:
+        # Unknown categories bind 0, which matches no row and so falls back.
+        category_id = CATEGORY_IDS.get(preferred_category, 0)
 
+    with get_ro_connection() as conn:
+        return _fetch_businesses(
+            conn, _RECOMMENDATION_QUERY, (category_id, category_id)
+        )
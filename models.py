@@ -2,7 +2,8 @@
 Data models used by the Town Square application.
 
 These models are simple containers for information
-read from and written to the SQLite database.
+read from and written to the SQLite database. They are frozen and
+slotted so instances stay small and can be shared safely between screens.
 """
 
 from __future__ import annotations
@@ -11,9 +12,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Business:
-    """Represents a local business shown in the directory."""
+    """
+    Represents a local business shown in the directory.
+
+    Field order matches ``database.BUSINESS_COLUMNS`` so rows can be
+    unpacked positionally.
+    """
 
     id: int
     name: str
@@ -21,10 +27,10 @@ class Business:
     average_rating: float
     review_count: int
     deal_text: str
-    is_favorite: bool
+    is_favorite: bool  # stored as 0/1; only used for its truth value
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Review:
     """Represents a single user review for a business."""
 
@@ -35,7 +41,7 @@ class Review:
     created_at: str  # ISO string stored in the database
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReportSummary:
     """Aggregated information for the Reports screen."""
 
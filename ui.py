@@ -9,9 +9,12 @@ The design aims to be:
 
 from __future__ import annotations
 
+import concurrent.futures
+import itertools
 import tkinter as tk
+from functools import lru_cache, partial
 from tkinter import messagebox, ttk
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import database
 from database import (
@@ -23,11 +26,12 @@ from database import (
     initialize_database,
     toggle_favorite,
 )
-from models import Business
+from models import Business, ReportSummary
 from utils import (
     VerificationChallenge,
     check_verification_answer,
     generate_verification_challenge,
+    generate_verification_challenge_pair,
     get_current_timestamp,
     validate_business_name,
     validate_deal_text,
@@ -53,10 +57,217 @@ FONT_SUBHEADING = ("Segoe UI", 12, "bold")
 FONT_BODY = ("Segoe UI", 11)
 FONT_SMALL = ("Segoe UI", 10)
 
+# Options for the multi-line tk.Text inputs, which have no ttk equivalent.
+_TEXT_INPUT = {"font": FONT_BODY, "fg": COLOR_TEXT_PRIMARY, "bg": COLOR_INPUT_BG}
+
+# Hard cap on characters in the review box. It sits well above the
+# validation limit so users still see the friendly "too long" message.
+MAX_REVIEW_CHARS = 2000
+
+# When the table starts out empty, rows are inserted this many at a time,
+# yielding to the event loop in between so large lists do not freeze the UI.
+ROW_INSERT_CHUNK = 50
+
+# How often (ms) the Tk thread checks for finished background database work.
+DB_POLL_MS = 15
+
+# ttk style table: (style name, configure options, state map options).
+_STYLE_SPEC = (
+    ("TFrame", {"background": COLOR_BG_MAIN}, {}),
+    ("Card.TFrame", {"background": COLOR_CARD_BG}, {}),
+    (
+        "Accent.TButton",
+        {
+            "font": FONT_BODY,
+            "padding": 6,
+            "foreground": "#FFFFFF",
+            "background": COLOR_ACCENT,
+        },
+        {"background": [("active", "#2A73DE")]},
+    ),
+    (
+        "Nav.TButton",
+        {
+            "font": FONT_BODY,
+            "padding": 8,
+            "foreground": "#FFFFFF",
+            "background": COLOR_BG_SIDEBAR,
+        },
+        {"background": [("active", "#123D77")]},
+    ),
+    # Label styles carry font and colors, so each label only names a style.
+    (
+        "Heading.TLabel",
+        {"font": FONT_HEADING, "foreground": COLOR_TEXT_PRIMARY, "background": COLOR_BG_MAIN},
+        {},
+    ),
+    (
+        "Body.TLabel",
+        {"font": FONT_BODY, "foreground": COLOR_TEXT_PRIMARY, "background": COLOR_BG_MAIN},
+        {},
+    ),
+    (
+        "Sub.TLabel",
+        {"font": FONT_BODY, "foreground": COLOR_TEXT_SECONDARY, "background": COLOR_BG_MAIN},
+        {},
+    ),
+    (
+        "Small.TLabel",
+        {"font": FONT_SMALL, "foreground": COLOR_TEXT_SECONDARY, "background": COLOR_BG_MAIN},
+        {},
+    ),
+    (
+        "AccentHeading.TLabel",
+        {"font": FONT_SUBHEADING, "foreground": COLOR_ACCENT, "background": COLOR_BG_MAIN},
+        {},
+    ),
+    (
+        "SidebarTitle.TLabel",
+        {"font": FONT_HEADING, "foreground": "#FFFFFF", "background": COLOR_BG_SIDEBAR},
+        {},
+    ),
+    (
+        "SidebarSmall.TLabel",
+        {"font": FONT_SMALL, "foreground": "#D6E6FF", "background": COLOR_BG_SIDEBAR},
+        {},
+    ),
+    (
+        "CardTitle.TLabel",
+        {"font": FONT_SUBHEADING, "foreground": COLOR_ACCENT, "background": COLOR_CARD_BG},
+        {},
+    ),
+    (
+        "CardHeading.TLabel",
+        {"font": FONT_SUBHEADING, "foreground": COLOR_TEXT_PRIMARY, "background": COLOR_CARD_BG},
+        {},
+    ),
+    (
+        "CardBody.TLabel",
+        {"font": FONT_BODY, "foreground": COLOR_TEXT_PRIMARY, "background": COLOR_CARD_BG},
+        {},
+    ),
+    (
+        "CardSmall.TLabel",
+        {"font": FONT_SMALL, "foreground": COLOR_TEXT_SECONDARY, "background": COLOR_CARD_BG},
+        {},
+    ),
+    (
+        "Treeview",
+        {
+            "background": COLOR_INPUT_BG,
+            "foreground": COLOR_TEXT_PRIMARY,
+            "fieldbackground": COLOR_INPUT_BG,
+            "rowheight": 26,
+            "borderwidth": 0,
+            "font": FONT_BODY,
+        },
+        {},
+    ),
+    (
+        "Treeview.Heading",
+        {
+            "font": FONT_SUBHEADING,
+            "background": COLOR_BG_SIDEBAR,
+            "foreground": "#FFFFFF",
+        },
+        {},
+    ),
+)
+
+
+@lru_cache(maxsize=1024)
+def _business_table_row(biz: Business) -> tuple[str, tuple]:
+    """
+    Format a business as a ``(iid, values)`` table row.
+
+    Business objects are frozen, so the cache is keyed on every field and a
+    business whose data has not changed reuses its formatted row.
+    """
+    rating_display = (
+        f"{biz.average_rating:.1f} ({biz.review_count})"
+        if biz.review_count > 0
+        else "No reviews yet"
+    )
+    favorite_icon = "★" if biz.is_favorite else ""
+    return (
+        str(biz.id),
+        (biz.name, biz.category, rating_display, biz.deal_text, favorite_icon),
+    )
+
+
+def _load_business_rows(
+    category_filter: str, sort_by_rating_desc: bool, favorites_only: bool
+) -> tuple[list[tuple[str, tuple]], dict[int, Business]]:
+    """
+    Fetch businesses for the directory table (runs on the worker).
+
+    Returns the formatted table rows plus the full records keyed by id, so
+    selecting a row needs no further query.
+    """
+    businesses = get_businesses(category_filter, sort_by_rating_desc, favorites_only)
+    rows = [_business_table_row(biz) for biz in businesses]
+    return rows, {biz.id: biz for biz in businesses}
+
+
+def _make_label(
+    parent: tk.Misc,
+    text: str,
+    style: str = "Body.TLabel",
+    **options,
+) -> ttk.Label:
+    """
+    Build a ttk label, body text unless another label ``style`` is given.
+
+    Fonts and colors come from the styles in ``_STYLE_SPEC``, so every label
+    in the app is created through this one helper.
+    """
+    return ttk.Label(parent, text=text, style=style, **options)
+
+
+def _sync_tree_rows(
+    tree: ttk.Treeview,
+    displayed: dict[str, tuple],
+    rows: list[tuple[str, tuple]],
+) -> dict[str, tuple]:
+    """
+    Make ``tree`` show ``rows`` (``(iid, values)`` pairs) in order.
+
+    ``displayed`` is what the previous call returned: the rows currently in
+    the tree, in display order. Only rows that were added, removed, or
+    changed are touched; rows are moved only when the order changed.
+    """
+    wanted = dict(rows)
+    # Fast path: a refresh that found nothing new needs no Tk calls at all.
+    # Row values are compared as whole tuples, so this also works as the
+    # per-row change check below.
+    if len(wanted) == len(displayed) and list(displayed.items()) == rows:
+        return displayed
+
+    stale = [iid for iid in displayed if iid not in wanted]
+    if stale:
+        tree.delete(*stale)
+
+    kept_order = [iid for iid in displayed if iid in wanted]
+    reordered = [iid for iid, _ in rows if iid in displayed] != kept_order
+
+    for index, (iid, values) in enumerate(rows):
+        old_values = displayed.get(iid)
+        if old_values is None:
+            tree.insert("", index, iid=iid, values=values)
+            continue
+        if old_values != values:
+            tree.item(iid, values=values)
+        if reordered:
+            tree.move(iid, "", index)
+
+    return wanted
+
 
 class TownSquareApp(tk.Tk):
     """Main Tkinter application window."""
 
+    _styled_interpreter: Optional[object] = None
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -70,6 +281,12 @@ class TownSquareApp(tk.Tk):
         # Apply a modern ttk style.
         self._configure_style()
 
+        # Database reads run on one worker thread so slow queries do not
+        # freeze the window; results are handed back on the Tk thread.
+        self.db_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._pending_db: list[tuple[concurrent.futures.Future, Callable]] = []
+        self._db_poll_scheduled = False
+
         # Layout: sidebar on the left, content on the right.
         self.sidebar = Sidebar(self, on_nav=self.show_screen)
         self.sidebar.grid(row=0, column=0, sticky="nsw")
@@ -80,8 +297,9 @@ class TownSquareApp(tk.Tk):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        # Screens
+        # Screens are built the first time they are shown.
         self.screens: dict[str, tk.Frame] = {}
+        self._screen_factories: dict[str, Callable[[], tk.Frame]] = {}
         self._create_screens()
 
         self.show_screen("directory")
@@ -89,6 +307,11 @@ class TownSquareApp(tk.Tk):
     # ------------------------- style ---------------------------------#
 
     def _configure_style(self) -> None:
+        # ttk styles belong to a Tcl interpreter, so they only need to be
+        # applied once per interpreter rather than once per window.
+        if TownSquareApp._styled_interpreter is self.tk:
+            return
+
         style = ttk.Style(self)
         # Use the system's default theme then customize.
         try:
@@ -96,74 +319,90 @@ class TownSquareApp(tk.Tk):
         except tk.TclError:
             pass
 
-        style.configure(
-            "TFrame",
-            background=COLOR_BG_MAIN,
-        )
-        style.configure(
-            "Card.TFrame",
-            background=COLOR_CARD_BG,
-        )
-        style.configure(
-            "Accent.TButton",
-            font=FONT_BODY,
-            padding=6,
-            foreground="#FFFFFF",
-            background=COLOR_ACCENT,
-        )
-        style.map(
-            "Accent.TButton",
-            background=[("active", "#2A73DE")],
-        )
-        style.configure(
-            "Nav.TButton",
-            font=FONT_BODY,
-            padding=8,
-            foreground="#FFFFFF",
-            background=COLOR_BG_SIDEBAR,
-        )
-        style.map(
-            "Nav.TButton",
-            background=[("active", "#123D77")],
-        )
+        for style_name, options, state_map in _STYLE_SPEC:
+            style.configure(style_name, **options)
+            if state_map:
+                style.map(style_name, **state_map)
+
+        TownSquareApp._styled_interpreter = self.tk
+
+    # ------------------------- background db ---------------------------#
+
+    def run_db(
+        self, fn: Callable, *args, on_done: Callable
+    ) -> concurrent.futures.Future:
+        """
+        Run ``fn(*args)`` on the database worker thread.
+
+        ``on_done(result)`` is called later on the Tk thread. Results are
+        delivered in the order the work was submitted. The returned future
+        lets callers check whether the work is still running.
+        """
+        future = self.db_pool.submit(fn, *args)
+        self._pending_db.append((future, on_done))
+        if not self._db_poll_scheduled:
+            self._db_poll_scheduled = True
+            self.after(DB_POLL_MS, self._poll_db)
+        return future
+
+    def _poll_db(self) -> None:
+        # Tk is only ever touched from this thread; the worker just
+        # computes results, which are collected here.
+        self._db_poll_scheduled = False
+        while self._pending_db and self._pending_db[0][0].done():
+            future, on_done = self._pending_db.pop(0)
+            try:
+                result = future.result()
+            except Exception as exc:  # pragma: no cover - defensive
+                messagebox.showerror(
+                    "Database error",
+                    f"Town Square could not load its data.\n\nDetails: {exc}",
+                )
+                continue
+            on_done(result)
 
-        style.configure(
-            "Treeview",
-            background=COLOR_INPUT_BG,
-            foreground=COLOR_TEXT_PRIMARY,
-            fieldbackground=COLOR_INPUT_BG,
-            rowheight=26,
-            borderwidth=0,
-            font=FONT_BODY,
-        )
-        style.configure(
-            "Treeview.Heading",
-            font=FONT_SUBHEADING,
-            background=COLOR_BG_SIDEBAR,
-            foreground="#FFFFFF",
-        )
+        if self._pending_db and not self._db_poll_scheduled:
+            self._db_poll_scheduled = True
+            self.after(DB_POLL_MS, self._poll_db)
 
     # ------------------------- screens --------------------------------#
 
     def _create_screens(self) -> None:
-        self.screens["directory"] = DirectoryScreen(self.container)
-        self.screens["favorites"] = DirectoryScreen(
-            self.container, favorites_only=True
-        )
-        self.screens["recommendations"] = RecommendationScreen(self.container)
-        self.screens["reports"] = ReportsScreen(self.container)
-        self.screens["help"] = HelpScreen(self.container)
-
-        for frame in self.screens.values():
-            frame.grid(row=0, column=0, sticky="nsew")
+        self._screen_factories = {
+            "directory": lambda: DirectoryScreen(self.container),
+            "recommendations": lambda: RecommendationScreen(self.container),
+            "reports": lambda: ReportsScreen(self.container),
+            "help": lambda: HelpScreen(self.container),
+        }
 
     def show_screen(self, name: str) -> None:
-        """Bring a screen to the front."""
+        """Bring a screen to the front, building it on first use."""
+        # Favorites is the directory screen switched to favorites-only mode.
+        favorites_only = name == "favorites"
+        if favorites_only:
+            name = "directory"
+
         frame = self.screens.get(name)
-        if frame is not None:
-            if isinstance(frame, DataAwareScreen):
-                frame.refresh()
-            frame.tkraise()
+        is_new = frame is None
+        if frame is None:
+            factory = self._screen_factories.get(name)
+            if factory is None:
+                return
+            # New screens load their data while being built.
+            frame = factory()
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.screens[name] = frame
+
+        # Screens that support a favorites-only mode are switched into the
+        # requested one (which refreshes them); others just refresh.
+        if getattr(frame, "favorites_only", favorites_only) != favorites_only:
+            frame.set_favorites_only(favorites_only)
+        elif not is_new:
+            # Any screen with a refresh() reloads its data when shown again.
+            refresh = getattr(frame, "refresh", None)
+            if callable(refresh):
+                refresh()
+        frame.tkraise()
 
 
 class Sidebar(tk.Frame):
@@ -173,21 +412,13 @@ class Sidebar(tk.Frame):
         super().__init__(master, bg=COLOR_BG_SIDEBAR, width=220)
         self.on_nav = on_nav
 
-        title = tk.Label(
-            self,
-            text="Town Square",
-            font=FONT_HEADING,
-            fg="#FFFFFF",
-            bg=COLOR_BG_SIDEBAR,
-        )
+        title = _make_label(self, "Town Square", "SidebarTitle.TLabel")
         title.pack(padx=16, pady=(20, 4), anchor="w")
 
-        subtitle = tk.Label(
+        subtitle = _make_label(
             self,
-            text="Byte‑Sized Business Boost",
-            font=FONT_SMALL,
-            fg="#D6E6FF",
-            bg=COLOR_BG_SIDEBAR,
+            "Byte‑Sized Business Boost",
+            "SidebarSmall.TLabel",
             wraplength=180,
             justify="left",
         )
@@ -203,12 +434,10 @@ class Sidebar(tk.Frame):
 
         self._add_nav_button("❓  Help & Instructions", "help")
 
-        footer = tk.Label(
+        footer = _make_label(
             self,
-            text="Designed for FBLA\n2025–2026",
-            font=FONT_SMALL,
-            fg="#D6E6FF",
-            bg=COLOR_BG_SIDEBAR,
+            "Designed for FBLA\n2025–2026",
+            "SidebarSmall.TLabel",
             justify="left",
         )
         footer.pack(side="bottom", padx=16, pady=18, anchor="w")
@@ -218,7 +447,7 @@ class Sidebar(tk.Frame):
             self,
             text=text,
             style="Nav.TButton",
-            command=lambda: self.on_nav(screen_name),
+            command=partial(self.on_nav, screen_name),
         )
         btn.pack(fill="x", padx=12, pady=4)
 
@@ -226,60 +455,92 @@ class Sidebar(tk.Frame):
 class DataAwareScreen(tk.Frame):
     """Base class for screens that can refresh their data."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._refresh_pending = False
+
     def refresh(self) -> None:  # pragma: no cover - UI glue
         pass
 
+    def request_refresh(self) -> None:
+        """
+        Refresh once the event loop is idle.
+
+        Several requests made in the same burst of events (for example a
+        filter change followed by a button click) collapse into one refresh.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._run_pending_refresh)
+
+    def _run_pending_refresh(self) -> None:
+        self._refresh_pending = False
+        self.refresh()
+
 
 class DirectoryScreen(DataAwareScreen):
     """
     Shows businesses in a table, with sorting, filtering,
     favorite toggling, and review submission.
+
+    The same screen serves the Favorites view by switching
+    ``favorites_only`` on.
     """
 
+    # (title, subtitle) for the full directory and the favorites view.
+    HEADER_TEXT = {
+        False: (
+            "Business Directory",
+            "Browse all small, local businesses in Town Square.",
+        ),
+        True: (
+            "Favorite Businesses",
+            "Your bookmarked local favorites, at a glance.",
+        ),
+    }
+
     def __init__(self, master: tk.Misc, favorites_only: bool = False) -> None:
         super().__init__(master, bg=COLOR_BG_MAIN)
         self.favorites_only = favorites_only
         self.current_challenge: Optional[VerificationChallenge] = None
         self.selected_business: Optional[Business] = None
-
-        title_text = "Business Directory" if not favorites_only else "Favorite Businesses"
-        subtitle_text = (
-            "Browse all small, local businesses in Town Square."
-            if not favorites_only
-            else "Your bookmarked local favorites, at a glance."
-        )
+        # Rows currently shown in the table, in order (see _sync_tree_rows).
+        self._displayed_rows: dict[str, tuple] = {}
+        # Bumped on every refresh so an unfinished chunked fill can tell it
+        # has been superseded.
+        self._fill_generation = 0
+        # Full records for the rows loaded by the last refresh.
+        self._visible_by_id: dict[int, Business] = {}
+        # Built on first use, then hidden and reused (see AddBusinessDialog).
+        self._add_dialog: Optional[AddBusinessDialog] = None
+
+        title_text, subtitle_text = self.HEADER_TEXT[favorites_only]
 
         header_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         header_frame.pack(fill="x", padx=20, pady=(18, 8))
 
-        title_label = tk.Label(
+        self.title_label = _make_label(
             header_frame,
             text=title_text,
-            font=FONT_HEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+            style="Heading.TLabel",
         )
-        title_label.pack(anchor="w")
+        self.title_label.pack(anchor="w")
 
-        subtitle_label = tk.Label(
+        self.subtitle_label = _make_label(
             header_frame,
             text=subtitle_text,
-            font=FONT_BODY,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            style="Sub.TLabel",
         )
-        subtitle_label.pack(anchor="w", pady=(2, 8))
+        self.subtitle_label.pack(anchor="w", pady=(2, 8))
 
         controls_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         controls_frame.pack(fill="x", padx=20, pady=(0, 8))
 
         # Category filter
-        tk.Label(
+        _make_label(
             controls_frame,
             text="Category:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+            style="Body.TLabel",
         ).pack(side="left", padx=(0, 6))
 
         self.category_var = tk.StringVar(value="All")
@@ -294,6 +555,12 @@ class DirectoryScreen(DataAwareScreen):
 
         # Rating sort
         self.sort_var = tk.BooleanVar(value=False)
+        # (category, sort) for the view that is not showing, keyed by
+        # favorites_only (see set_favorites_only).
+        self._saved_filters: dict[bool, tuple[str, bool]] = {
+            False: ("All", False),
+            True: ("All", False),
+        }
         sort_check = tk.Checkbutton(
             controls_frame,
             text="Sort by rating (high to low)",
@@ -311,7 +578,7 @@ class DirectoryScreen(DataAwareScreen):
             controls_frame,
             text="Apply Filters",
             style="Accent.TButton",
-            command=self.refresh,
+            command=self.request_refresh,
         )
         apply_btn.pack(side="right")
 
@@ -378,28 +645,26 @@ class DirectoryScreen(DataAwareScreen):
         right_frame.columnconfigure(0, weight=1)
         right_frame.rowconfigure(3, weight=1)
 
-        self.detail_title = tk.Label(
+        self.detail_title = _make_label(
             right_frame,
             text="Select a business to see details",
-            font=FONT_SUBHEADING,
-            fg=COLOR_ACCENT,
-            bg=COLOR_CARD_BG,
+            style="CardTitle.TLabel",
             anchor="w",
         )
         self.detail_title.grid(row=0, column=0, sticky="ew", padx=14, pady=(10, 4))
 
-        self.detail_info = tk.Label(
+        self.detail_info = _make_label(
             right_frame,
             text="",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
             justify="left",
             wraplength=420,
         )
         self.detail_info.grid(row=1, column=0, sticky="ew", padx=14)
 
-        self.favorite_var = tk.BooleanVar(value=False)
+        # Plain attribute: no widget is bound to this, so a Tk variable
+        # would only add Tcl round-trips.
+        self._is_favorite = False
         self.favorite_btn = ttk.Button(
             right_frame,
             text="Mark as Favorite",
@@ -411,12 +676,10 @@ class DirectoryScreen(DataAwareScreen):
         separator = ttk.Separator(right_frame, orient="horizontal")
         separator.grid(row=3, column=0, sticky="ew", padx=10, pady=(4, 6))
 
-        review_label = tk.Label(
+        review_label = _make_label(
             right_frame,
             text="Share your experience (review & rating):",
-            font=FONT_SUBHEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardHeading.TLabel",
             anchor="w",
         )
         review_label.grid(row=4, column=0, sticky="ew", padx=14)
@@ -424,12 +687,10 @@ class DirectoryScreen(DataAwareScreen):
         rating_frame = tk.Frame(right_frame, bg=COLOR_CARD_BG)
         rating_frame.grid(row=5, column=0, sticky="ew", padx=14, pady=(4, 0))
 
-        tk.Label(
+        _make_label(
             rating_frame,
             text="Rating (1–5):",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
         ).pack(side="left")
 
         self.rating_entry = ttk.Entry(rating_frame, width=5)
@@ -439,42 +700,36 @@ class DirectoryScreen(DataAwareScreen):
             right_frame,
             height=6,
             wrap="word",
-            font=FONT_BODY,
-            bg=COLOR_INPUT_BG,
-            fg=COLOR_TEXT_PRIMARY,
+            **_TEXT_INPUT,
         )
         self.review_text.grid(row=6, column=0, sticky="nsew", padx=14, pady=(6, 2))
+        self.review_text.bind("<KeyPress>", self._limit_review_typing)
+        self.review_text.bind("<<Paste>>", self._limit_review_paste)
 
         # Verification area
         verify_frame = tk.Frame(right_frame, bg=COLOR_CARD_BG)
         verify_frame.grid(row=7, column=0, sticky="ew", padx=14, pady=(4, 0))
 
-        self.verify_label = tk.Label(
+        self.verify_label = _make_label(
             verify_frame,
             text="Human check: click 'New Challenge' before submitting.",
-            font=FONT_SMALL,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_CARD_BG,
+            style="CardSmall.TLabel",
             wraplength=350,
             justify="left",
         )
         self.verify_label.grid(row=0, column=0, columnspan=3, sticky="w")
 
-        self.verify_question_label = tk.Label(
+        self.verify_question_label = _make_label(
             verify_frame,
             text="",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
         )
         self.verify_question_label.grid(row=1, column=0, sticky="w", pady=(4, 0))
 
-        tk.Label(
+        _make_label(
             verify_frame,
             text="Your answer:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
         ).grid(row=1, column=1, sticky="e", padx=(10, 4))
 
         self.verify_entry = ttk.Entry(verify_frame, width=8)
@@ -497,41 +752,75 @@ class DirectoryScreen(DataAwareScreen):
 
     # --------------------- data operations ----------------------------#
 
-    def refresh(self) -> None:
-        """Reload the business list from the database."""
-        self.tree.delete(*self.tree.get_children())
+    def refresh(self, on_loaded: Optional[Callable[[], None]] = None) -> None:
+        """
+        Reload the business list from the database in the background.
+
+        ``on_loaded`` (if given) runs once the new rows are on screen.
+        """
         category = self.category_var.get()
-        sort_by_rating = self.sort_var.get()
+        # Rows are formatted on the worker, ready for the table.
+        self.winfo_toplevel().run_db(
+            _load_business_rows,
+            category,
+            self.sort_var.get(),
+            self.favorites_only,
+            on_done=lambda result: self._apply_rows(*result, category, on_loaded),
+        )
+
+    def set_favorites_only(self, favorites_only: bool) -> None:
+        """Switch between the full directory and the favorites view."""
+        # Each view keeps its own category and sort choices, as it did when
+        # the two were separate screens.
+        self._saved_filters[self.favorites_only] = (
+            self.category_var.get(),
+            self.sort_var.get(),
+        )
+        category, sort_by_rating = self._saved_filters[favorites_only]
+        self.category_var.set(category)
+        self.sort_var.set(sort_by_rating)
 
-        businesses = get_businesses(
-            category_filter=category,
-            sort_by_rating_desc=sort_by_rating,
-            favorites_only=self.favorites_only,
-        )
+        self.favorites_only = favorites_only
+        title_text, subtitle_text = self.HEADER_TEXT[favorites_only]
+        self.title_label.config(text=title_text)
+        self.subtitle_label.config(text=subtitle_text)
+        self.refresh()
 
-        for biz in businesses:
-            rating_display = (
-                f"{biz.average_rating:.1f} ({biz.review_count})"
-                if biz.review_count > 0
-                else "No reviews yet"
-            )
-            favorite_icon = "★" if biz.is_favorite else ""
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(biz.id),
-                values=(
-                    biz.name,
-                    biz.category,
-                    rating_display,
-                    biz.deal_text,
-                    favorite_icon,
-                ),
+    def _apply_rows(
+        self,
+        rows: list[tuple[str, tuple]],
+        businesses_by_id: dict[int, Business],
+        category: str,
+        on_loaded: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._visible_by_id = businesses_by_id
+        self._fill_generation += 1
+        if not self._displayed_rows and len(rows) > ROW_INSERT_CHUNK:
+            # Nothing to diff against: stream the rows in over several idle
+            # ticks. on_loaded waits until the last chunk is in.
+            self._fill_rows(iter(rows), self._fill_generation, on_loaded)
+            on_loaded = None
+        else:
+            self._displayed_rows = _sync_tree_rows(
+                self.tree, self._displayed_rows, rows
             )
+        # Rows are now kept between refreshes, so clear the old selection
+        # to match the reset details panel below.
+        self.tree.selection_set(())
 
         # If we are in the favorites screen and there are no favorites yet,
         # gently guide the user back to the directory.
-        if self.favorites_only and not businesses:
+        if self.favorites_only and not rows and category != "All":
+            # There may be favorites, just none in the chosen category.
+            self.detail_title.config(text=f"No {category} favorites")
+            self.detail_info.config(
+                text=(
+                    "None of your favorites are in this category.\n\n"
+                    "Tip: Choose “All” in the Category filter to see every "
+                    "business you have marked as a favorite."
+                )
+            )
+        elif self.favorites_only and not rows:
             self.detail_title.config(text="No favorites yet")
             self.detail_info.config(
                 text=(
@@ -547,22 +836,37 @@ class DirectoryScreen(DataAwareScreen):
         self.selected_business = None
         self._clear_review_form()
 
+        if on_loaded is not None:
+            on_loaded()
+
+    def _fill_rows(
+        self,
+        rows: Iterator[tuple[str, tuple]],
+        generation: int,
+        on_loaded: Optional[Callable[[], None]],
+    ) -> None:
+        """Append the next ROW_INSERT_CHUNK rows, then reschedule itself."""
+        if generation != self._fill_generation:
+            # A newer refresh took over; it diffs against what we inserted.
+            return
+        chunk = list(itertools.islice(rows, ROW_INSERT_CHUNK))
+        for iid, values in chunk:
+            self.tree.insert("", "end", iid=iid, values=values)
+            self._displayed_rows[iid] = values
+        if len(chunk) == ROW_INSERT_CHUNK:
+            self.after(0, self._fill_rows, rows, generation, on_loaded)
+        elif on_loaded is not None:
+            on_loaded()
+
     def _on_tree_select(self, event) -> None:  # pragma: no cover - UI callback
         item_id = self.tree.selection()
         if not item_id:
             return
-        biz_id = int(item_id[0])
-
-        # We only need one business, so filter quickly.
-        businesses = get_businesses(
-            category_filter="All",
-            sort_by_rating_desc=False,
-            favorites_only=False,
-        )
-        for biz in businesses:
-            if biz.id == biz_id:
-                self._set_selected_business(biz)
-                return
+        # Only rows from the current refresh can be selected, so the lookup
+        # stays within the visible set and needs no query.
+        biz = self._visible_by_id.get(int(item_id[0]))
+        if biz is not None:
+            self._set_selected_business(biz)
 
     def _set_selected_business(self, biz: Business) -> None:
         self.selected_business = biz
@@ -581,11 +885,11 @@ class DirectoryScreen(DataAwareScreen):
 
         self.detail_title.config(text=biz.name)
         self.detail_info.config(text=info)
-        self.favorite_var.set(biz.is_favorite)
+        self._is_favorite = biz.is_favorite
         self._update_favorite_button_text()
 
     def _update_favorite_button_text(self) -> None:
-        if self.favorite_var.get():
+        if self._is_favorite:
             self.favorite_btn.config(text="★ Favorited – click to remove")
         else:
             self.favorite_btn.config(text="Mark as Favorite")
@@ -598,12 +902,12 @@ class DirectoryScreen(DataAwareScreen):
             )
             return
 
-        new_state = not self.favorite_var.get()
+        new_state = not self._is_favorite
         try:
             toggle_favorite(self.selected_business.id, new_state)
-            self.favorite_var.set(new_state)
+            self._is_favorite = new_state
             self._update_favorite_button_text()
-            self.refresh()
+            self.request_refresh()
         except Exception as exc:  # pragma: no cover - defensive
             messagebox.showerror(
                 "Error updating favorite",
@@ -611,6 +915,34 @@ class DirectoryScreen(DataAwareScreen):
             )
             return
 
+    def _review_length(self) -> int:
+        return len(self.review_text.get("1.0", "end-1c"))
+
+    def _limit_review_typing(self, event: tk.Event) -> Optional[str]:
+        """Stop new characters once the review box holds MAX_REVIEW_CHARS."""
+        typed = event.char
+        # Navigation, deletion, and shortcut keys are always allowed, and so
+        # is typing over a selection (it does not grow the text).
+        if not typed or not (typed.isprintable() or typed in "\r\t"):
+            return None
+        if self.review_text.tag_ranges("sel"):
+            return None
+        if self._review_length() >= MAX_REVIEW_CHARS:
+            self.bell()
+            return "break"
+        return None
+
+    def _limit_review_paste(self, event: tk.Event) -> Optional[str]:
+        """Refuse a paste that would push the review past MAX_REVIEW_CHARS."""
+        try:
+            pasted = self.clipboard_get()
+        except tk.TclError:
+            return None
+        if self._review_length() + len(pasted) > MAX_REVIEW_CHARS:
+            self.bell()
+            return "break"
+        return None
+
     def _new_challenge(self) -> None:
         self.current_challenge = generate_verification_challenge()
         self.verify_question_label.config(text=self.current_challenge.prompt)
@@ -632,7 +964,8 @@ class DirectoryScreen(DataAwareScreen):
             return
 
         rating_str = self.rating_entry.get()
-        review_body = self.review_text.get("1.0", tk.END)
+        # "end-1c" skips the newline Tk always keeps at the end of the text.
+        review_body = self.review_text.get("1.0", "end-1c").strip()
 
         rating_ok, rating_msg = validate_rating(rating_str)
         if not rating_ok:
@@ -670,7 +1003,7 @@ class DirectoryScreen(DataAwareScreen):
             add_review(
                 business_id=self.selected_business.id,
                 rating=rating_value,
-                text=review_body.strip(),
+                text=review_body,
                 created_at=get_current_timestamp(),
             )
         except Exception as exc:  # pragma: no cover - defensive
@@ -691,44 +1024,48 @@ class DirectoryScreen(DataAwareScreen):
         """Open the dialog used to add a new business to the platform."""
 
         def on_added(new_business: Business) -> None:
-            # Refresh the list and highlight the newly added business.
-            self.refresh()
-            item_id = str(new_business.id)
-            if item_id in self.tree.get_children():
-                self.tree.selection_set(item_id)
-                self.tree.see(item_id)
-                self._set_selected_business(new_business)
-
-        AddBusinessDialog(self, on_added=on_added)
+            # Refresh the list, then highlight the newly added business.
+            def highlight() -> None:
+                item_id = str(new_business.id)
+                if item_id in self._displayed_rows:
+                    self.tree.selection_set(item_id)
+                    self.tree.see(item_id)
+                    self._set_selected_business(new_business)
+
+            self.refresh(on_loaded=highlight)
+
+        dialog = self._add_dialog
+        if dialog is None or not dialog.winfo_exists():
+            self._add_dialog = AddBusinessDialog(self, on_added=on_added)
+        else:
+            dialog.reset(on_added)
 
 
 class RecommendationScreen(DataAwareScreen):
     """Shows recommended businesses using simple, explainable rules."""
 
+    REC_CACHE_SIZE = 8
+
     def __init__(self, master: tk.Misc) -> None:
         super().__init__(master, bg=COLOR_BG_MAIN)
 
         header_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         header_frame.pack(fill="x", padx=20, pady=(18, 8))
 
-        title_label = tk.Label(
+        title_label = _make_label(
             header_frame,
             text="Smart Recommendations",
-            font=FONT_HEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+            style="Heading.TLabel",
         )
         title_label.pack(anchor="w")
 
-        subtitle_label = tk.Label(
+        subtitle_label = _make_label(
             header_frame,
             text=(
                 "Town Square suggests businesses by looking at your favorites, "
                 "preferred category, and high community ratings."
             ),
-            font=FONT_BODY,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            style="Sub.TLabel",
             wraplength=700,
             justify="left",
         )
@@ -737,12 +1074,10 @@ class RecommendationScreen(DataAwareScreen):
         controls_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         controls_frame.pack(fill="x", padx=20, pady=(0, 8))
 
-        tk.Label(
+        _make_label(
             controls_frame,
             text="Preferred category:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+            style="Body.TLabel",
         ).pack(side="left", padx=(0, 6))
 
         self.category_var = tk.StringVar(value="All")
@@ -763,7 +1098,7 @@ class RecommendationScreen(DataAwareScreen):
         )
         refresh_btn.pack(side="left", padx=(12, 0))
 
-        explanation_label = tk.Label(
+        explanation_label = _make_label(
             self,
             text=(
                 "How it works:\n"
@@ -775,9 +1110,7 @@ class RecommendationScreen(DataAwareScreen):
                 "This makes the logic easy to explain to judges while still "
                 "feeling smart to users."
             ),
-            font=FONT_SMALL,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            style="Small.TLabel",
             justify="left",
             wraplength=760,
         )
@@ -815,61 +1148,73 @@ class RecommendationScreen(DataAwareScreen):
         table_frame.rowconfigure(0, weight=1)
         table_frame.columnconfigure(0, weight=1)
 
+        self._displayed_rows: dict[str, tuple] = {}
+        # Results per (category, database.DATA_GENERATION); a write bumps
+        # the generation, so stale entries are simply never looked up again.
+        self._rec_cache: dict[tuple[str, int], list[Business]] = {}
         self.refresh()
 
     def refresh(self) -> None:
-        self.tree.delete(*self.tree.get_children())
         category = self.category_var.get()
-        businesses = get_recommended_businesses(preferred_category=category)
+        key = (category, database.DATA_GENERATION)
+        businesses = self._rec_cache.get(key)
+        if businesses is not None:
+            self._show_businesses(businesses)
+            return
 
-        for biz in businesses:
-            rating_display = (
-                f"{biz.average_rating:.1f} ({biz.review_count})"
-                if biz.review_count > 0
-                else "No reviews yet"
-            )
-            favorite_icon = "★" if biz.is_favorite else ""
-            self.tree.insert(
-                "",
-                "end",
-                iid=str(biz.id),
-                values=(
-                    biz.name,
-                    biz.category,
-                    rating_display,
-                    biz.deal_text,
-                    favorite_icon,
-                ),
-            )
+        self.winfo_toplevel().run_db(
+            get_recommended_businesses,
+            category,
+            on_done=partial(self._on_recommendations_loaded, key),
+        )
+
+    def _on_recommendations_loaded(
+        self, key: tuple[str, int], businesses: list[Business]
+    ) -> None:
+        if len(self._rec_cache) >= self.REC_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order).
+            del self._rec_cache[next(iter(self._rec_cache))]
+        self._rec_cache[key] = businesses
+        self._show_businesses(businesses)
+
+    def _show_businesses(self, businesses: list[Business]) -> None:
+        rows = [_business_table_row(biz) for biz in businesses]
+        self._displayed_rows = _sync_tree_rows(self.tree, self._displayed_rows, rows)
 
 
 class ReportsScreen(DataAwareScreen):
     """Shows key analytics about the local business community."""
 
+    TOP_COUNT = 3
+    REFRESH_DEBOUNCE_MS = 50
+    # (heading, anchor) for each column of the top businesses table.
+    TABLE_COLUMNS = (
+        ("#", "center"),
+        ("Business", "w"),
+        ("Category", "center"),
+        ("Average Rating", "center"),
+    )
+
     def __init__(self, master: tk.Misc) -> None:
         super().__init__(master, bg=COLOR_BG_MAIN)
 
         header_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         header_frame.pack(fill="x", padx=20, pady=(18, 8))
 
-        title_label = tk.Label(
+        title_label = _make_label(
             header_frame,
             text="Community Snapshot & Reports",
-            font=FONT_HEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+            style="Heading.TLabel",
         )
         title_label.pack(anchor="w")
 
-        subtitle_label = tk.Label(
+        subtitle_label = _make_label(
             header_frame,
             text=(
                 "Quickly see how many local businesses are listed, "
                 "how well they are rated, and which ones stand out."
             ),
-            font=FONT_BODY,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            style="Sub.TLabel",
         )
         subtitle_label.pack(anchor="w", pady=(2, 8))
 
@@ -880,41 +1225,33 @@ class ReportsScreen(DataAwareScreen):
         summary_card = ttk.Frame(content_frame, style="Card.TFrame")
         summary_card.grid(row=0, column=0, sticky="nsew", padx=(0, 10), pady=(0, 10))
 
-        summary_title = tk.Label(
+        summary_title = _make_label(
             summary_card,
             text="Key Numbers",
-            font=FONT_SUBHEADING,
-            fg=COLOR_ACCENT,
-            bg=COLOR_CARD_BG,
+            style="CardTitle.TLabel",
         )
         summary_title.pack(anchor="w", padx=14, pady=(12, 6))
 
-        self.total_label = tk.Label(
+        self.total_label = _make_label(
             summary_card,
             text="Total businesses: –",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
             anchor="w",
         )
         self.total_label.pack(fill="x", padx=14, pady=2)
 
-        self.average_label = tk.Label(
+        self.average_label = _make_label(
             summary_card,
             text="Average rating (all businesses): –",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
             anchor="w",
         )
         self.average_label.pack(fill="x", padx=14, pady=2)
 
-        self.favorite_label = tk.Label(
+        self.favorite_label = _make_label(
             summary_card,
             text="Number of favorited businesses: –",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
+            style="CardBody.TLabel",
             anchor="w",
         )
         self.favorite_label.pack(fill="x", padx=14, pady=(2, 12))
@@ -923,63 +1260,170 @@ class ReportsScreen(DataAwareScreen):
         top_card = ttk.Frame(content_frame, style="Card.TFrame")
         top_card.grid(row=0, column=1, sticky="nsew", pady=(0, 10))
 
-        top_title = tk.Label(
+        top_title = _make_label(
             top_card,
             text="Top 3 Highest‑Rated Businesses",
-            font=FONT_SUBHEADING,
-            fg=COLOR_ACCENT,
-            bg=COLOR_CARD_BG,
+            style="CardTitle.TLabel",
         )
         top_title.pack(anchor="w", padx=14, pady=(12, 6))
 
-        columns = ("rank", "name", "category", "rating")
-        self.tree = ttk.Treeview(
-            top_card,
-            columns=columns,
-            show="headings",
-            selectmode="none",
-        )
-        self.tree.heading("rank", text="#")
-        self.tree.heading("name", text="Business")
-        self.tree.heading("category", text="Category")
-        self.tree.heading("rating", text="Average Rating")
-
-        self.tree.column("rank", width=30, anchor="center")
-        self.tree.column("name", width=180, anchor="w")
-        self.tree.column("category", width=100, anchor="center")
-        self.tree.column("rating", width=120, anchor="center")
-
-        self.tree.pack(fill="both", expand=True, padx=12, pady=(0, 12))
+        # The table never holds more than TOP_COUNT rows, so it is a fixed
+        # grid of labels rather than a Treeview.
+        table = ttk.Frame(top_card, style="Card.TFrame")
+        table.pack(fill="both", expand=True, padx=14, pady=(0, 12))
+
+        for column, (heading, anchor) in enumerate(self.TABLE_COLUMNS):
+            _make_label(
+                table,
+                text=heading,
+                style="CardHeading.TLabel",
+                anchor=anchor,
+            ).grid(row=0, column=column, sticky="ew", padx=4, pady=(0, 4))
+        table.columnconfigure(1, weight=1)
+
+        self._row_labels = [
+            [
+                _make_label(table, "", "CardBody.TLabel", anchor=anchor)
+                for _, anchor in self.TABLE_COLUMNS
+            ]
+            for _ in range(self.TOP_COUNT)
+        ]
+        for row, labels in enumerate(self._row_labels, start=1):
+            for column, label in enumerate(labels):
+                label.grid(row=row, column=column, sticky="ew", padx=4, pady=2)
+        # Text last given to each summary label and table cell, so labels
+        # are only reconfigured when what they show actually changes.
+        self._label_text: dict[ttk.Label, str] = {}
+        # Snapshot shown by the previous refresh, used to skip no-op updates.
+        self._last_summary: Optional[ReportSummary] = None
+        # Summary query currently on the database worker, if any.
+        self._summary_future: Optional[concurrent.futures.Future] = None
+        self._summary_stale = False
+        # Pending debounced refresh (see refresh()).
+        self._refresh_after_id: Optional[str] = None
 
         content_frame.columnconfigure(0, weight=1)
         content_frame.columnconfigure(1, weight=1)
         content_frame.rowconfigure(0, weight=1)
 
-        self.refresh()
+        # The first load has nothing to coalesce with, so skip the debounce.
+        self._load_summary()
 
     def refresh(self) -> None:
-        summary = get_reports_summary()
+        """
+        Schedule a reload of the summary.
+
+        Calls that arrive within REFRESH_DEBOUNCE_MS of each other (screen
+        switches, reviews, favorites) collapse into one query.
+        """
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(
+            self.REFRESH_DEBOUNCE_MS, self._debounced_load
+        )
+
+    def _debounced_load(self) -> None:
+        # Only the scheduled callback clears the id, so a direct load never
+        # orphans a pending debounced one.
+        self._refresh_after_id = None
+        self._load_summary()
+
+    def _load_summary(self) -> None:
+        """Load the summary on the database worker, then update the screen."""
+        if self._summary_future is not None and not self._summary_future.done():
+            # One query at a time; run again once the current one lands.
+            self._summary_stale = True
+            return
+        self._summary_stale = False
+        self._summary_future = self.winfo_toplevel().run_db(
+            get_reports_summary, on_done=self._apply_summary
+        )
+
+    def _apply_summary(self, summary: ReportSummary) -> None:
+        self._summary_future = None
+        if self._summary_stale:
+            # Data changed while this query ran; show it, then reload.
+            self._load_summary()
+
+        previous = self._last_summary
+        # ReportSummary is a frozen dataclass, so equality compares every
+        # field (top businesses included) and an unchanged snapshot costs
+        # no Tk calls at all.
+        if summary == previous:
+            return
+        self._last_summary = summary
 
-        self.total_label.config(text=f"Total businesses: {summary.total_businesses}")
-        self.average_label.config(
-            text=f"Average rating (businesses with reviews): {summary.average_rating:.2f}"
+        self._set_text(
+            self.total_label, f"Total businesses: {summary.total_businesses}"
         )
-        self.favorite_label.config(
-            text=f"Number of favorited businesses: {summary.favorite_count}"
+        self._set_text(
+            self.average_label,
+            f"Average rating (businesses with reviews): {summary.average_rating:.2f}",
         )
+        self._set_text(
+            self.favorite_label,
+            f"Number of favorited businesses: {summary.favorite_count}",
+        )
+
+        if previous is not None and summary.top_businesses == previous.top_businesses:
+            return
 
-        self.tree.delete(*self.tree.get_children())
-        for index, biz in enumerate(summary.top_businesses, start=1):
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    index,
+        top = summary.top_businesses
+        for row, labels in enumerate(self._row_labels):
+            if row < len(top):
+                biz = top[row]
+                texts = (
+                    str(row + 1),
                     biz.name,
                     biz.category,
                     f"{biz.average_rating:.2f} ({biz.review_count})",
-                ),
-            )
+                )
+            else:
+                # Fewer than TOP_COUNT rated businesses: blank the spare rows.
+                texts = ("", "", "", "")
+            for label, text in zip(labels, texts):
+                self._set_text(label, text)
+
+    def _set_text(self, label: ttk.Label, text: str) -> None:
+        # Label.config makes Tk re-measure the label, so skip it when the
+        # text is the same (e.g. an average that moved past the 2nd decimal).
+        if self._label_text.get(label) != text:
+            label.config(text=text)
+            self._label_text[label] = text
+
+
+# Static copy for the Help screen.
+_HELP_TEXT = (
+    "Overview\n"
+    "────────\n"
+    "Town Square is a small‑business discovery tool built specifically for the "
+    "FBLA Coding & Programming topic “Byte‑Sized Business Boost”.\n\n"
+    "Navigation\n"
+    "──────────\n"
+    "• Directory – Browse all local businesses, see their deals, and read ratings.\n"
+    "• Favorites – Quickly jump to businesses you have marked with a star.\n"
+    "• Recommendations – See smart suggestions based on favorites, category, and ratings.\n"
+    "• Reports – View summary statistics and the top three highest‑rated businesses.\n"
+    "• Help – The screen you are reading now.\n\n"
+    "Adding Reviews & Ratings\n"
+    "────────────────────────\n"
+    "1. Go to the Directory screen.\n"
+    "2. Click a business in the list on the left.\n"
+    "3. Enter a rating from 1 to 5 and type a short review.\n"
+    "4. Click “New Challenge” and answer the simple math question.\n"
+    "5. Click “Submit Review”. If any input is invalid, a friendly error message "
+    "will explain what to fix.\n\n"
+    "Favorites & Deals\n"
+    "────────────────\n"
+    "• Use the gold “Mark as Favorite” button to bookmark a business.\n"
+    "• The Directory and Recommendations screens show a star icon next to favorites.\n"
+    "• Each business includes a clearly displayed special deal or coupon.\n\n"
+    "Accessibility\n"
+    "─────────────\n"
+    "• Large, high‑contrast fonts make text readable from a distance during judging.\n"
+    "• Clear button labels explain exactly what each action does.\n"
+    "• The layout avoids clutter so users can focus on a single panel at a time.\n"
+)
 
 
 class HelpScreen(tk.Frame):
@@ -991,66 +1435,26 @@ class HelpScreen(tk.Frame):
         header_frame = tk.Frame(self, bg=COLOR_BG_MAIN)
         header_frame.pack(fill="x", padx=20, pady=(18, 8))
 
-        title_label = tk.Label(
-            header_frame,
-            text="Help & Instructions",
-            font=FONT_HEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+        title_label = _make_label(
+            header_frame, "Help & Instructions", "Heading.TLabel"
         )
         title_label.pack(anchor="w")
 
-        subtitle_label = tk.Label(
+        subtitle_label = _make_label(
             header_frame,
-            text="A quick tour of how to use Town Square during judging or in real life.",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            "A quick tour of how to use Town Square during judging or in real life.",
+            "Sub.TLabel",
         )
         subtitle_label.pack(anchor="w", pady=(2, 8))
 
         card = ttk.Frame(self, style="Card.TFrame")
         card.pack(fill="both", expand=True, padx=20, pady=(0, 16))
 
-        text = (
-            "Overview\n"
-            "────────\n"
-            "Town Square is a small‑business discovery tool built specifically for the "
-            "FBLA Coding & Programming topic “Byte‑Sized Business Boost”.\n\n"
-            "Navigation\n"
-            "──────────\n"
-            "• Directory – Browse all local businesses, see their deals, and read ratings.\n"
-            "• Favorites – Quickly jump to businesses you have marked with a star.\n"
-            "• Recommendations – See smart suggestions based on favorites, category, and ratings.\n"
-            "• Reports – View summary statistics and the top three highest‑rated businesses.\n"
-            "• Help – The screen you are reading now.\n\n"
-            "Adding Reviews & Ratings\n"
-            "────────────────────────\n"
-            "1. Go to the Directory screen.\n"
-            "2. Click a business in the list on the left.\n"
-            "3. Enter a rating from 1 to 5 and type a short review.\n"
-            "4. Click “New Challenge” and answer the simple math question.\n"
-            "5. Click “Submit Review”. If any input is invalid, a friendly error message "
-            "will explain what to fix.\n\n"
-            "Favorites & Deals\n"
-            "────────────────\n"
-            "• Use the gold “Mark as Favorite” button to bookmark a business.\n"
-            "• The Directory and Recommendations screens show a star icon next to favorites.\n"
-            "• Each business includes a clearly displayed special deal or coupon.\n\n"
-            "Accessibility\n"
-            "─────────────\n"
-            "• Large, high‑contrast fonts make text readable from a distance during judging.\n"
-            "• Clear button labels explain exactly what each action does.\n"
-            "• The layout avoids clutter so users can focus on a single panel at a time.\n"
-        )
-
-        instructions = tk.Label(
+        instructions = _make_label(
             card,
-            text=text,
+            _HELP_TEXT,
+            "CardBody.TLabel",
             justify="left",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_CARD_BG,
             anchor="nw",
         )
         instructions.pack(fill="both", expand=True, padx=16, pady=16)
@@ -1068,6 +1472,9 @@ class AddBusinessDialog(tk.Toplevel):
 
     def __init__(self, master: tk.Misc, on_added) -> None:
         super().__init__(master)
+        # Stay hidden while the widgets are built so the window is mapped
+        # once, fully laid out, instead of growing as each row is gridded.
+        self.withdraw()
         self.title("Add New Business")
         self.configure(bg=COLOR_BG_MAIN)
         self.resizable(False, False)
@@ -1076,56 +1483,39 @@ class AddBusinessDialog(tk.Toplevel):
         self.challenge_one: Optional[VerificationChallenge] = None
         self.challenge_two: Optional[VerificationChallenge] = None
 
-        # Ensure the dialog appears above the main window and grabs focus.
+        # Ensure the dialog appears above the main window.
         self.transient(master.winfo_toplevel())
-        self.grab_set()
 
         container = tk.Frame(self, bg=COLOR_BG_MAIN)
         container.pack(fill="both", expand=True, padx=20, pady=16)
 
-        title = tk.Label(
-            container,
-            text="Add a New Local Business",
-            font=FONT_HEADING,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        )
+        title = _make_label(container, "Add a New Local Business", "Heading.TLabel")
         title.grid(row=0, column=0, columnspan=2, sticky="w", pady=(0, 6))
 
-        subtitle = tk.Label(
+        subtitle = _make_label(
             container,
-            text=(
+            (
                 "Use this form to list a new small business in Town Square.\n"
                 "To keep entries trustworthy, a quick two‑step human check is required."
             ),
-            font=FONT_BODY,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            "Sub.TLabel",
             justify="left",
             wraplength=420,
         )
         subtitle.grid(row=1, column=0, columnspan=2, sticky="w", pady=(0, 10))
 
         # Business name
-        tk.Label(
-            container,
-            text="Business name:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        ).grid(row=2, column=0, sticky="e", padx=(0, 8), pady=(4, 2))
+        _make_label(container, "Business name:").grid(
+            row=2, column=0, sticky="e", padx=(0, 8), pady=(4, 2)
+        )
 
         self.name_entry = ttk.Entry(container, width=40)
         self.name_entry.grid(row=2, column=1, sticky="w", pady=(4, 2))
 
         # Category
-        tk.Label(
-            container,
-            text="Category:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        ).grid(row=3, column=0, sticky="e", padx=(0, 8), pady=(4, 2))
+        _make_label(container, "Category:").grid(
+            row=3, column=0, sticky="e", padx=(0, 8), pady=(4, 2)
+        )
 
         self.category_var = tk.StringVar(value="Food")
         self.category_combo = ttk.Combobox(
@@ -1138,22 +1528,16 @@ class AddBusinessDialog(tk.Toplevel):
         self.category_combo.grid(row=3, column=1, sticky="w", pady=(4, 2))
 
         # Deal text
-        tk.Label(
-            container,
-            text="Special deal or coupon:",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        ).grid(row=4, column=0, sticky="ne", padx=(0, 8), pady=(6, 2))
+        _make_label(container, "Special deal or coupon:").grid(
+            row=4, column=0, sticky="ne", padx=(0, 8), pady=(6, 2)
+        )
 
         self.deal_text = tk.Text(
             container,
             height=4,
             width=40,
             wrap="word",
-            font=FONT_BODY,
-            bg=COLOR_INPUT_BG,
-            fg=COLOR_TEXT_PRIMARY,
+            **_TEXT_INPUT,
         )
         self.deal_text.grid(row=4, column=1, sticky="w", pady=(6, 2))
 
@@ -1161,67 +1545,45 @@ class AddBusinessDialog(tk.Toplevel):
         sep = ttk.Separator(container, orient="horizontal")
         sep.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(10, 8))
 
-        verify_label = tk.Label(
-            container,
-            text="Two‑step human verification",
-            font=FONT_SUBHEADING,
-            fg=COLOR_ACCENT,
-            bg=COLOR_BG_MAIN,
+        verify_label = _make_label(
+            container, "Two‑step human verification", "AccentHeading.TLabel"
         )
         verify_label.grid(row=6, column=0, columnspan=2, sticky="w", pady=(0, 4))
 
-        helper = tk.Label(
+        helper = _make_label(
             container,
-            text=(
+            (
                 "To prevent automated bots from listing fake businesses, please "
                 "solve both quick math questions below before submitting."
             ),
-            font=FONT_SMALL,
-            fg=COLOR_TEXT_SECONDARY,
-            bg=COLOR_BG_MAIN,
+            "Small.TLabel",
             justify="left",
             wraplength=420,
         )
         helper.grid(row=7, column=0, columnspan=2, sticky="w", pady=(0, 8))
 
         # Challenge 1
-        self.challenge1_label = tk.Label(
-            container,
-            text="Step 1 question will appear here.",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+        self.challenge1_label = _make_label(
+            container, "Step 1 question will appear here."
         )
         self.challenge1_label.grid(row=8, column=0, columnspan=2, sticky="w")
 
-        tk.Label(
-            container,
-            text="Your answer (step 1):",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        ).grid(row=9, column=0, sticky="e", padx=(0, 8), pady=(2, 2))
+        _make_label(container, "Your answer (step 1):").grid(
+            row=9, column=0, sticky="e", padx=(0, 8), pady=(2, 2)
+        )
 
         self.challenge1_entry = ttk.Entry(container, width=10)
         self.challenge1_entry.grid(row=9, column=1, sticky="w", pady=(2, 2))
 
         # Challenge 2
-        self.challenge2_label = tk.Label(
-            container,
-            text="Step 2 question will appear here.",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
+        self.challenge2_label = _make_label(
+            container, "Step 2 question will appear here."
         )
         self.challenge2_label.grid(row=10, column=0, columnspan=2, sticky="w", pady=(6, 0))
 
-        tk.Label(
-            container,
-            text="Your answer (step 2):",
-            font=FONT_BODY,
-            fg=COLOR_TEXT_PRIMARY,
-            bg=COLOR_BG_MAIN,
-        ).grid(row=11, column=0, sticky="e", padx=(0, 8), pady=(2, 2))
+        _make_label(container, "Your answer (step 2):").grid(
+            row=11, column=0, sticky="e", padx=(0, 8), pady=(2, 2)
+        )
 
         self.challenge2_entry = ttk.Entry(container, width=10)
         self.challenge2_entry.grid(row=11, column=1, sticky="w", pady=(2, 2))
@@ -1249,17 +1611,42 @@ class AddBusinessDialog(tk.Toplevel):
         cancel_btn = ttk.Button(
             button_frame,
             text="Cancel",
-            command=self.destroy,
+            command=self._close,
         )
         cancel_btn.pack(side="left", padx=(8, 0))
 
+        # The dialog is hidden rather than destroyed so it can be reopened
+        # without rebuilding its widgets.
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
         # Start with challenges ready.
         self._generate_challenges()
 
+        # Show the finished dialog and grab focus.
+        self.deiconify()
+        self.grab_set()
+
+    def reset(self, on_added) -> None:
+        """Clear the form and show the (previously hidden) dialog again."""
+        self.on_added = on_added
+        self.name_entry.delete(0, tk.END)
+        self.category_var.set("Food")
+        self.deal_text.delete("1.0", tk.END)
+        self._generate_challenges()
+
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.name_entry.focus_set()
+
+    def _close(self) -> None:
+        """Hide the dialog and give input back to the main window."""
+        self.grab_release()
+        self.withdraw()
+
     def _generate_challenges(self) -> None:
         """Create two fresh math questions."""
-        self.challenge_one = generate_verification_challenge()
-        self.challenge_two = generate_verification_challenge()
+        self.challenge_one, self.challenge_two = generate_verification_challenge_pair()
 
         self.challenge1_label.config(text=f"Step 1: {self.challenge_one.prompt}")
         self.challenge2_label.config(text=f"Step 2: {self.challenge_two.prompt}")
@@ -1271,7 +1658,7 @@ class AddBusinessDialog(tk.Toplevel):
         """Validate all fields, run two-step verification, and add the business."""
         name = self.name_entry.get()
         category = self.category_var.get()
-        deal = self.deal_text.get("1.0", tk.END)
+        deal = self.deal_text.get("1.0", "end-1c")
 
         # Basic field validation
         ok, msg = validate_business_name(name)
@@ -1340,7 +1727,7 @@ class AddBusinessDialog(tk.Toplevel):
 
         # Notify the parent screen and close the dialog.
         self.on_added(new_business)
-        self.destroy()
+        self._close()
 
 
 def run_app() -> None:
@@ -1360,5 +1747,9 @@ def run_app() -> None:
         return
 
     app = TownSquareApp()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        app.db_pool.shutdown(wait=True, cancel_futures=True)
+        database.close_connections()
 
@@ -8,11 +8,14 @@ input validation and simple human‑verification logic.
 from __future__ import annotations
 
 import random
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Tuple
 
 
+_VALID_RATINGS = frozenset("12345")
+
 MIN_REVIEW_LENGTH = 10
 MAX_REVIEW_LENGTH = 500
 
@@ -23,9 +26,26 @@ MIN_DEAL_LENGTH = 5
 MAX_DEAL_LENGTH = 200
 
 
+# (whole second, formatted timestamp) from the last call.
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+
 def get_current_timestamp() -> str:
-    """Return the current time as an ISO‑8601 string."""
-    return datetime.now().isoformat(timespec="seconds")
+    """
+    Return the current time as an ISO‑8601 string.
+
+    The string only changes once per second, so it is reused for every
+    call within the same second.
+    """
+    global _last_timestamp
+    second = int(time.time())
+    if _last_timestamp[0] != second:
+        # Build the new pair first so another thread never sees it half-set.
+        _last_timestamp = (
+            second,
+            datetime.fromtimestamp(second).isoformat(timespec="seconds"),
+        )
+    return _last_timestamp[1]
 
 
 def validate_rating(value: str) -> Tuple[bool, str]:
@@ -35,10 +55,16 @@ def validate_rating(value: str) -> Tuple[bool, str]:
     Returns (is_valid, message). On success, message is an empty string.
     """
     value = value.strip()
+    # Nearly every rating is a single digit, answered with one set lookup.
+    if value in _VALID_RATINGS:
+        return True, ""
+
     if not value:
         return False, "Please enter a rating from 1 to 5."
 
-    if not value.isdigit():
+    # isdecimal(), not isdigit(): digits like "²" pass isdigit() but int()
+    # cannot parse them.
+    if not value.isdecimal():
         return False, "Rating must be a whole number between 1 and 5."
 
     rating = int(value)
@@ -48,24 +74,52 @@ def validate_rating(value: str) -> Tuple[bool, str]:
     return True, ""
 
 
+# Validation messages, built once rather than on every call.
+_REVIEW_TOO_SHORT = (
+    f"Review is too short. Please use at least {MIN_REVIEW_LENGTH} characters."
+)
+_REVIEW_TOO_LONG = (
+    f"Review is quite long. Please stay under {MAX_REVIEW_LENGTH} characters."
+)
+_NAME_TOO_SHORT = "Business name is too short. Please use a descriptive name."
+_NAME_TOO_LONG = (
+    f"Business name is quite long. Please stay under {MAX_BUSINESS_NAME_LENGTH} characters."
+)
+_DEAL_TOO_SHORT = "Please describe the special deal or coupon (a few words are enough)."
+_DEAL_TOO_LONG = (
+    f"Deal text is quite long. Please stay under {MAX_DEAL_LENGTH} characters."
+)
+
+
+def _bounded(
+    text: str, min_length: int, max_length: int, short_msg: str, long_msg: str
+) -> Tuple[bool, str]:
+    """Shared length check for the free-text validators below."""
+    # Reject oversized input without scanning it: if neither end is
+    # whitespace, strip() would not shorten it anyway.
+    if (
+        len(text) > max_length
+        and not text[0].isspace()
+        and not text[-1].isspace()
+    ):
+        return False, long_msg
+    length = len(text.strip())
+    if length < min_length:
+        return False, short_msg
+    if length > max_length:
+        return False, long_msg
+    return True, ""
+
+
 def validate_review_text(text: str) -> Tuple[bool, str]:
     """
     Validate review text length and content.
 
     Returns (is_valid, message). On success, message is an empty string.
     """
-    stripped = text.strip()
-    if len(stripped) < MIN_REVIEW_LENGTH:
-        return (
-            False,
-            f"Review is too short. Please use at least {MIN_REVIEW_LENGTH} characters.",
-        )
-    if len(stripped) > MAX_REVIEW_LENGTH:
-        return (
-            False,
-            f"Review is quite long. Please stay under {MAX_REVIEW_LENGTH} characters.",
-        )
-    return True, ""
+    return _bounded(
+        text, MIN_REVIEW_LENGTH, MAX_REVIEW_LENGTH, _REVIEW_TOO_SHORT, _REVIEW_TOO_LONG
+    )
 
 
 def validate_business_name(text: str) -> Tuple[bool, str]:
@@ -74,65 +128,81 @@ def validate_business_name(text: str) -> Tuple[bool, str]:
 
     Names must be present and reasonably short so they display cleanly.
     """
-    stripped = text.strip()
-    if len(stripped) < MIN_BUSINESS_NAME_LENGTH:
-        return (
-            False,
-            "Business name is too short. Please use a descriptive name.",
-        )
-    if len(stripped) > MAX_BUSINESS_NAME_LENGTH:
-        return (
-            False,
-            f"Business name is quite long. Please stay under {MAX_BUSINESS_NAME_LENGTH} characters.",
-        )
-    return True, ""
+    return _bounded(
+        text,
+        MIN_BUSINESS_NAME_LENGTH,
+        MAX_BUSINESS_NAME_LENGTH,
+        _NAME_TOO_SHORT,
+        _NAME_TOO_LONG,
+    )
 
 
 def validate_deal_text(text: str) -> Tuple[bool, str]:
     """
     Validate the special deal or coupon text for a business.
     """
-    stripped = text.strip()
-    if len(stripped) < MIN_DEAL_LENGTH:
-        return (
-            False,
-            "Please describe the special deal or coupon (a few words are enough).",
-        )
-    if len(stripped) > MAX_DEAL_LENGTH:
-        return (
-            False,
-            f"Deal text is quite long. Please stay under {MAX_DEAL_LENGTH} characters.",
-        )
-    return True, ""
+    return _bounded(
+        text, MIN_DEAL_LENGTH, MAX_DEAL_LENGTH, _DEAL_TOO_SHORT, _DEAL_TOO_LONG
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerificationChallenge:
-    """Represents a simple human‑verification math challenge."""
+    """
+    Represents a simple human‑verification math challenge.
+
+    Frozen because the same instances are shared from a prebuilt pool.
+    """
 
     prompt: str
     answer: int
 
 
+def _build_challenge_pool() -> Tuple[VerificationChallenge, ...]:
+    """
+    Build every challenge generate_verification_challenge can return.
+
+    There are only 9 * 9 * 2 = 162 of them, so they are made once at import.
+    Each (a, b, operation) combination appears once, which keeps the odds of
+    each question the same as picking a, b, and the operation at random.
+    """
+    pool = []
+    for a in range(1, 10):
+        for b in range(1, 10):
+            pool.append(VerificationChallenge(prompt=f"What is {a} + {b}?", answer=a + b))
+            # Ensure we do not go negative to keep answers simple.
+            bigger, smaller = max(a, b), min(a, b)
+            pool.append(
+                VerificationChallenge(
+                    prompt=f"What is {bigger} - {smaller}?", answer=bigger - smaller
+                )
+            )
+    return tuple(pool)
+
+
+_CHALLENGE_POOL = _build_challenge_pool()
+# The pool repeats subtraction questions (a - b and b - a read the same);
+# pairs are drawn from this de-duplicated copy so both steps always differ.
+_DISTINCT_CHALLENGES = tuple(dict.fromkeys(_CHALLENGE_POOL))
+
+
 def generate_verification_challenge() -> VerificationChallenge:
     """
-    Create a small math problem that is easy for humans
+    Pick a small math problem that is easy for humans
     but inconvenient for automated bots.
     """
-    a = random.randint(1, 9)
-    b = random.randint(1, 9)
-    operation = random.choice(["+", "-"])
+    return random.choice(_CHALLENGE_POOL)
 
-    if operation == "+":
-        prompt = f"What is {a} + {b}?"
-        answer = a + b
-    else:
-        # Ensure we do not go negative to keep answers simple.
-        bigger, smaller = max(a, b), min(a, b)
-        prompt = f"What is {bigger} - {smaller}?"
-        answer = bigger - smaller
 
-    return VerificationChallenge(prompt=prompt, answer=answer)
+def generate_verification_challenge_pair() -> Tuple[
+    VerificationChallenge, VerificationChallenge
+]:
+    """
+    Pick two different challenges at once, for the two-step check used
+    when adding a business.
+    """
+    first, second = random.sample(_DISTINCT_CHALLENGES, 2)
+    return first, second
 
 
 def check_verification_answer(challenge: VerificationChallenge, user_input: str) -> bool:
@@ -140,7 +210,9 @@ def check_verification_answer(challenge: VerificationChallenge, user_input: str)
     Check whether the user solved the verification challenge correctly.
     """
     user_input = user_input.strip()
-    if not user_input.isdigit():
+    # Plain digits only: int() on its own would also accept "+5", "-0"
+    # and "1_0". Every isdecimal() string is safe to pass to int().
+    if not user_input.isdecimal():
         return False
     return int(user_input) == challenge.answer
 